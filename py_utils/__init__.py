@@ -11,7 +11,15 @@ This package provides reusable utilities for common programming tasks including:
 from .logger import Logger, get_logger
 
 # Email utilities
-from .email_helper import EmailHelper, send_quick_email
+from .email_helper import (
+    BatchAborted,
+    EmailHelper,
+    EmailSendError,
+    SMTPSetupError,
+    SMTPTimeoutError,
+    send_quick_email,
+    send_quick_many,
+)
 
 # Housekeeper utilities
 from .housekeeper import Housekeeper, cleanup_directory
@@ -24,6 +32,11 @@ __all__ = [
     # Email
     "EmailHelper",
     "send_quick_email",
+    "send_quick_many",
+    "BatchAborted",
+    "SMTPSetupError",
+    "SMTPTimeoutError",
+    "EmailSendError",
     # Housekeeper
     "Housekeeper",
     "cleanup_directory",
@@ -1,10 +1,86 @@
+import atexit
 import smtplib
+import threading
+from email.message import EmailMessage, Message
+from email.policy import SMTP as SMTP_POLICY
+from email.utils import parseaddr
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional
+from itertools import islice
+from typing import Iterable, Optional
 import ssl
 
 
+class SMTPSetupError(Exception):
+    """Raised when an SMTP connection cannot be established."""
+
+
+class EmailSendError(Exception):
+    """Raised when an email cannot be sent."""
+
+
+class BatchAborted(Exception):
+    """Raised by send_many() when too many messages in a batch have failed."""
+
+    def __init__(self, message: str, results: list[bool]):
+        super().__init__(message)
+        self.results = results
+
+
+class SMTPTimeoutError(smtplib.SMTPException, TimeoutError):
+    """Raised when the SMTP server does not respond within the timeout."""
+
+
+# Idle pooled connections keyed by (smtp_server, port, username, use_tls),
+# stored together with the number of messages already sent on them.
+_SMTP_POOL: dict[tuple, tuple[smtplib.SMTP, int]] = {}
+# Connections currently checked out of the pool: id(server) -> (key, sent)
+_SMTP_IN_USE: dict[int, tuple[tuple, int]] = {}
+_SMTP_POOL_LOCK = threading.Lock()
+
+
+_DEFAULT_SSL_CTX: Optional[ssl.SSLContext] = None
+
+
+def _get_ssl_ctx() -> ssl.SSLContext:
+    """Return the shared default SSL context, creating it on first use."""
+    global _DEFAULT_SSL_CTX
+    if _DEFAULT_SSL_CTX is None:
+        # Loading the system CA store is costly, so do it once per process
+        _DEFAULT_SSL_CTX = ssl.create_default_context()
+    return _DEFAULT_SSL_CTX
+
+
+# Recipient placeholder in messages serialized by EmailHelper.prepare_template()
+_TO_PLACEHOLDER = "__PLACEHOLDER__"
+
+
+def _is_timeout(error: BaseException) -> bool:
+    """Whether an smtplib error was caused by a socket timeout."""
+    if isinstance(error, TimeoutError):
+        return True
+    # smtplib catches socket errors, closes the connection and raises
+    # SMTPServerDisconnected, leaving the timeout as the implicit context
+    return isinstance(error, smtplib.SMTPServerDisconnected) and isinstance(
+        error.__context__, TimeoutError
+    )
+
+
+def _batch_failing(
+    failed: int, attempted: int, abort_threshold: float, min_batch_for_abort: int
+) -> bool:
+    """Whether a batch has failed often enough that it should be aborted."""
+    return attempted >= min_batch_for_abort and failed / attempted > abort_threshold
+
+
+def _quit_quietly(server: smtplib.SMTP) -> None:
+    """Close an SMTP connection, ignoring errors from an already dead peer."""
+    try:
+        server.quit()
+    except (smtplib.SMTPException, OSError):
+        server.close()
+
+
 class EmailHelper:
     """A helper class for sending emails via SMTP."""
 
@@ -15,6 +91,8 @@ class EmailHelper:
         username: Optional[str] = None,
         password: Optional[str] = None,
         use_tls: bool = False,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        timeout: float = 30.0,
     ) -> smtplib.SMTP:
         """
         Set up an SMTP connection.
@@ -25,6 +103,9 @@ class EmailHelper:
             username: SMTP username for authentication
             password: SMTP password for authentication
             use_tls: Whether to use TLS encryption
+            ssl_context: SSL context for TLS connections (default: a shared
+                context from ssl.create_default_context())
+            timeout: Seconds to wait for the server before giving up
 
         Returns:
             Configured SMTP connection
@@ -32,58 +113,315 @@ class EmailHelper:
         try:
             if use_tls:
                 server = smtplib.SMTP_SSL(
-                    smtp_server, port, context=ssl.create_default_context()
+                    smtp_server,
+                    port,
+                    timeout=timeout,
+                    context=ssl_context or _get_ssl_ctx(),
                 )
             else:
-                server = smtplib.SMTP(smtp_server, port)
+                server = smtplib.SMTP(smtp_server, port, timeout=timeout)
                 if username and password:
                     server.login(username, password)
             return server
         except Exception as e:
-            raise Exception(f"Failed to setup SMTP connection: {str(e)}")
+            if _is_timeout(e):
+                raise SMTPTimeoutError(
+                    f"Timed out connecting to SMTP server {smtp_server}:{port}"
+                ) from e
+            raise SMTPSetupError("Failed to setup SMTP connection") from e
 
     @staticmethod
-    def send_email(
+    def send_many(
         server: smtplib.SMTP,
+        messages: Iterable[dict],
+        abort_threshold: float = 1 / 3,
+        min_batch_for_abort: int = 30,
+    ) -> list[bool]:
+        """
+        Send a batch of emails over a single SMTP session.
+
+        Each message is a dict with the keyword arguments of send_email()
+        (from_addr, to_addr, subject, body and optionally html_body).
+        Individual failures are recorded rather than raised, but the batch
+        is aborted once enough messages have failed to suggest the server
+        is rejecting us.
+
+        Args:
+            server: Configured SMTP server instance
+            messages: Iterable of message dicts
+            abort_threshold: Abort when more than this fraction of sends failed
+            min_batch_for_abort: Minimum number of attempts before aborting
+
+        Returns:
+            List with True/False per message, in input order
+
+        Raises:
+            BatchAborted: If the failure rate exceeded abort_threshold. The
+                exception's results attribute holds the results so far.
+        """
+        results = []
+        failed = 0
+        for message in messages:
+            sent = EmailHelper._send_batch_message(server, message)
+            results.append(sent)
+            failed += not sent
+
+            attempted = len(results)
+            if _batch_failing(failed, attempted, abort_threshold, min_batch_for_abort):
+                raise BatchAborted(
+                    f"Aborted batch after {failed} of {attempted} sends failed",
+                    results,
+                )
+
+        return results
+
+    @staticmethod
+    def _send_batch_message(server: smtplib.SMTP, message: dict) -> bool:
+        """Send one send_many() message dict, returning False if it failed."""
+        try:
+            msg = EmailHelper._build_message(**message)
+            server.send_message(msg, message["from_addr"], message["to_addr"])
+            return True
+        except (smtplib.SMTPException, OSError, ValueError):
+            return False
+
+    @staticmethod
+    def prepare_template(
         from_addr: str,
-        to_addr: str,
         subject: str,
         body: str,
         html_body: Optional[str] = None,
-    ) -> bool:
+    ) -> bytes:
         """
-        Send an email using the provided SMTP server.
+        Serialize a message once for sending to many recipients.
+
+        The result can be passed to send_prepared() for each recipient, so
+        the MIME encoding is not redone for every message of a bulk send.
 
         Args:
-            server: Configured SMTP server instance
             from_addr: Sender email address
-            to_addr: Recipient email address
             subject: Email subject
             body: Plain text email body
             html_body: Optional HTML email body
 
+        Returns:
+            Serialized message with a placeholder recipient
+        """
+        msg = EmailHelper._build_message(
+            from_addr, _TO_PLACEHOLDER, subject, body, html_body
+        )
+        # sendmail() only normalizes line endings for str payloads, so
+        # serialize with the CRLF line endings SMTP requires
+        return msg.as_bytes(policy=msg.policy.clone(linesep="\r\n"))
+
+    @staticmethod
+    def send_prepared(
+        server: smtplib.SMTP,
+        from_addr: str,
+        to_addr: str,
+        template_bytes: bytes,
+    ) -> bool:
+        """
+        Send a message serialized by prepare_template() to one recipient.
+
+        Args:
+            server: Configured SMTP server instance
+            from_addr: Sender email address
+            to_addr: Recipient email address
+            template_bytes: Output of prepare_template()
+
         Returns:
             True if email sent successfully
         """
+        if "\r" in to_addr or "\n" in to_addr:
+            raise ValueError("Recipient address must not contain line breaks")
+        # Non-ASCII mailboxes need SMTPUTF8, which is never negotiated
+        if not parseaddr(to_addr)[1].isascii():
+            raise ValueError("Recipient address must be ASCII")
+
+        # RFC 2047-encode a non-ASCII display name, as send_email() does
+        to_header = SMTP_POLICY.fold_binary("To", to_addr)
+        # Only substitute the whole To line within the header block, so a
+        # subject or body quoting the placeholder is left untouched
+        header_end = template_bytes.index(b"\r\n\r\n") + 2
+        headers = template_bytes[:header_end].replace(
+            f"\r\nTo: {_TO_PLACEHOLDER}\r\n".encode(), b"\r\n" + to_header, 1
+        )
+        payload = headers + template_bytes[header_end:]
         try:
-            msg = MIMEMultipart("alternative")
+            server.sendmail(from_addr, [to_addr], payload)
+            return True
+        except Exception as e:
+            if _is_timeout(e):
+                raise SMTPTimeoutError("Timed out sending email") from e
+            raise EmailSendError("Failed to send email") from e
+
+    @staticmethod
+    def get_or_create_smtp(
+        smtp_server: str,
+        port: int = 25,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        use_tls: bool = False,
+        timeout: float = 30.0,
+    ) -> smtplib.SMTP:
+        """
+        Check out a pooled SMTP connection, creating one if none is idle.
+
+        Idle connections are health checked with NOOP before being handed
+        out and transparently replaced if the server has dropped them.
+        Return the connection with release_smtp() when done.
+
+        Args:
+            smtp_server: SMTP server address
+            port: SMTP port (default: 25)
+            username: SMTP username for authentication
+            password: SMTP password for authentication
+            use_tls: Whether to use TLS encryption
+            timeout: Seconds to wait for the server when connecting
+
+        Returns:
+            Connected SMTP server instance
+        """
+        key = (smtp_server, port, username, use_tls)
+        with _SMTP_POOL_LOCK:
+            server, sent = _SMTP_POOL.pop(key, (None, 0))
+
+        if server is not None:
+            try:
+                if server.noop()[0] != 250:
+                    raise smtplib.SMTPServerDisconnected("NOOP health check failed")
+            except (smtplib.SMTPException, OSError):
+                # Don't QUIT an unresponsive peer; that would wait out another timeout
+                server.close()
+                server = None
+
+        if server is None:
+            server = EmailHelper.setup_smtp(
+                smtp_server, port, username, password, use_tls, timeout=timeout
+            )
+            sent = 0
+
+        with _SMTP_POOL_LOCK:
+            _SMTP_IN_USE[id(server)] = (key, sent)
+        return server
+
+    @staticmethod
+    def release_smtp(
+        server: smtplib.SMTP,
+        messages_sent: int = 1,
+        max_messages_per_connection: int = 100,
+        discard: bool = False,
+    ) -> None:
+        """
+        Return a connection obtained from get_or_create_smtp() to the pool.
+
+        The connection is closed instead of pooled when it is discarded, has
+        reached max_messages_per_connection, or another idle connection for
+        the same server is already pooled.
+
+        Args:
+            server: SMTP server instance to release
+            messages_sent: Number of messages sent since it was checked out
+            max_messages_per_connection: Recycle the connection after this many messages
+            discard: Close the connection without QUIT instead of pooling it
+                (e.g. after an error)
+        """
+        with _SMTP_POOL_LOCK:
+            key, sent = _SMTP_IN_USE.pop(id(server), (None, 0))
+            sent += messages_sent
+            if (
+                key is not None
+                and not discard
+                and sent < max_messages_per_connection
+                and key not in _SMTP_POOL
+            ):
+                _SMTP_POOL[key] = (server, sent)
+                return
+
+        if discard:
+            # The session may be broken or hung, so drop it without QUIT
+            server.close()
+        else:
+            _quit_quietly(server)
+
+    @staticmethod
+    def close_all() -> None:
+        """Close every idle pooled SMTP connection."""
+        with _SMTP_POOL_LOCK:
+            servers = [server for server, _ in _SMTP_POOL.values()]
+            _SMTP_POOL.clear()
+
+        for server in servers:
+            _quit_quietly(server)
+
+    @staticmethod
+    def _build_message(
+        from_addr: str,
+        to_addr: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+    ) -> Message:
+        """Build the MIME message sent by send_email() and send_many()."""
+        # compat32 MIMEMultipart headers would accept line breaks, so check
+        # up front to reject header injection the same way for both paths
+        for value in (from_addr, to_addr, subject):
+            if "\r" in value or "\n" in value:
+                raise ValueError("Header values must not contain line breaks")
+
+        if not html_body:
+            # Plain text only: a single-part message, no multipart wrapper.
+            # Quoted-printable keeps non-ASCII bodies 7-bit clean, since the
+            # server is not asked for 8BITMIME.
+            msg = EmailMessage()
             msg["Subject"] = subject
             msg["From"] = from_addr
             msg["To"] = to_addr
+            msg.set_content(body, cte="quoted-printable")
+            return msg
 
-            # Attach plain text body
-            text_part = MIMEText(body, "plain")
-            msg.attach(text_part)
+        msg = MIMEMultipart("alternative")
+        msg["Subject"] = subject
+        msg["From"] = from_addr
+        msg["To"] = to_addr
+        msg.attach(MIMEText(body, "plain"))
+        msg.attach(MIMEText(html_body, "html"))
+        return msg
 
-            # Attach HTML body if provided
-            if html_body:
-                html_part = MIMEText(html_body, "html")
-                msg.attach(html_part)
+    @staticmethod
+    def send_email(
+        server: smtplib.SMTP,
+        from_addr: str,
+        to_addr: str,
+        subject: str,
+        body: str,
+        html_body: Optional[str] = None,
+    ) -> bool:
+        """
+        Send an email using the provided SMTP server.
+
+        Args:
+            server: Configured SMTP server instance
+            from_addr: Sender email address
+            to_addr: Recipient email address
+            subject: Email subject
+            body: Plain text email body
+            html_body: Optional HTML email body
 
-            server.sendmail(from_addr, to_addr, msg.as_string())
+        Returns:
+            True if email sent successfully
+        """
+        try:
+            msg = EmailHelper._build_message(
+                from_addr, to_addr, subject, body, html_body
+            )
+            server.send_message(msg, from_addr, to_addr)
             return True
         except Exception as e:
-            raise Exception(f"Failed to send email: {str(e)}")
+            if _is_timeout(e):
+                raise SMTPTimeoutError("Timed out sending email") from e
+            raise EmailSendError("Failed to send email") from e
 
 
 # Convenience function for quick email sending
@@ -98,6 +436,9 @@ def send_quick_email(
     password: Optional[str] = None,
     use_tls: bool = False,
     html_body: Optional[str] = None,
+    reuse: bool = False,
+    max_messages_per_connection: int = 100,
+    timeout: float = 30.0,
 ) -> bool:
     """
     Quick function to send an email with minimal setup.
@@ -113,17 +454,122 @@ def send_quick_email(
         password: SMTP password
         use_tls: Whether to use TLS
         html_body: Optional HTML email body
+        reuse: Keep the connection in a pool for subsequent calls instead of
+            opening a new one per message
+        max_messages_per_connection: Recycle a pooled connection after this
+            many messages (only used when reuse is True)
+        timeout: Seconds to wait for the server before giving up
 
     Returns:
         True if email sent successfully
     """
-    server = None
+    if reuse:
+        server = EmailHelper.get_or_create_smtp(
+            smtp_server, port, username, password, use_tls, timeout=timeout
+        )
+        try:
+            result = EmailHelper.send_email(
+                server, from_addr, to_addr, subject, body, html_body
+            )
+        except Exception:
+            EmailHelper.release_smtp(server, discard=True)
+            raise
+        EmailHelper.release_smtp(
+            server, max_messages_per_connection=max_messages_per_connection
+        )
+        return result
+
+    server = EmailHelper.setup_smtp(
+        smtp_server, port, username, password, use_tls, timeout=timeout
+    )
     try:
-        server = EmailHelper.setup_smtp(smtp_server, port, username, password, use_tls)
         result = EmailHelper.send_email(
             server, from_addr, to_addr, subject, body, html_body
         )
-        return result
-    finally:
-        if server:
-            server.quit()
+    except Exception:
+        # Don't QUIT after a failure: a hung peer would block for another
+        # timeout and its error would replace the original one
+        server.close()
+        raise
+    _quit_quietly(server)
+    return result
+
+
+def send_quick_many(
+    smtp_server: str,
+    messages: Iterable[dict],
+    port: int = 25,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+    use_tls: bool = False,
+    max_messages_per_connection: int = 100,
+    timeout: float = 30.0,
+    abort_threshold: float = 1 / 3,
+    min_batch_for_abort: int = 30,
+) -> list[bool]:
+    """
+    Quick function to send a batch of emails over pooled connections.
+
+    The batch is split so that no connection sends more than
+    max_messages_per_connection messages; a fresh connection is checked out
+    for the remainder once the limit is reached.
+
+    Args:
+        smtp_server: SMTP server address
+        messages: Iterable of message dicts (see EmailHelper.send_many)
+        port: SMTP port (default: 25)
+        username: SMTP username
+        password: SMTP password
+        use_tls: Whether to use TLS
+        max_messages_per_connection: Maximum number of messages sent over one connection
+        timeout: Seconds to wait for the server before giving up
+        abort_threshold: Abort when more than this fraction of sends failed
+        min_batch_for_abort: Minimum number of attempts before aborting
+
+    Returns:
+        List with True/False per message, in input order
+
+    Raises:
+        BatchAborted: If the failure rate over the whole batch exceeded
+            abort_threshold. The exception's results attribute holds the
+            results so far.
+    """
+    results = []
+    failed = 0
+    messages = iter(messages)
+    while (first := next(messages, None)) is not None:
+        server = EmailHelper.get_or_create_smtp(
+            smtp_server, port, username, password, use_tls, timeout=timeout
+        )
+        with _SMTP_POOL_LOCK:
+            _, already_sent = _SMTP_IN_USE[id(server)]
+        room = max(1, max_messages_per_connection - already_sent)
+        chunk = [first, *islice(messages, room - 1)]
+
+        try:
+            # Check the failure rate of the whole batch after every message,
+            # not per chunk, so chunking does not change when we abort
+            for message in chunk:
+                sent = EmailHelper._send_batch_message(server, message)
+                results.append(sent)
+                failed += not sent
+                if _batch_failing(
+                    failed, len(results), abort_threshold, min_batch_for_abort
+                ):
+                    raise BatchAborted(
+                        f"Aborted batch after {failed} of {len(results)} sends failed",
+                        results,
+                    )
+        except Exception:
+            EmailHelper.release_smtp(server, discard=True)
+            raise
+        EmailHelper.release_smtp(
+            server,
+            messages_sent=len(chunk),
+            max_messages_per_connection=max_messages_per_connection,
+        )
+
+    return results
+
+
+atexit.register(EmailHelper.close_all)
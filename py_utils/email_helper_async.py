@@ -0,0 +1,117 @@
+import asyncio
+from typing import Iterable
+
+from .email_helper import EmailHelper, _get_ssl_ctx
+
+try:
+    import aiosmtplib
+except ImportError:
+    aiosmtplib = None
+
+
+async def _connect(smtp_config: dict) -> "aiosmtplib.SMTP":
+    """Open and authenticate an aiosmtplib connection from an smtp_config dict."""
+    use_tls = smtp_config.get("use_tls", False)
+    tls_context = None
+    if use_tls:
+        tls_context = smtp_config.get("ssl_context") or _get_ssl_ctx()
+
+    client = aiosmtplib.SMTP(
+        hostname=smtp_config["smtp_server"],
+        port=smtp_config.get("port", 25),
+        use_tls=use_tls,
+        # Match EmailHelper.setup_smtp: plain connections are not upgraded
+        start_tls=False,
+        timeout=smtp_config.get("timeout", 30.0),
+        tls_context=tls_context,
+    )
+    await client.connect()
+
+    username = smtp_config.get("username")
+    password = smtp_config.get("password")
+    if username and password:
+        try:
+            await client.login(username, password)
+        except BaseException:
+            client.close()
+            raise
+    return client
+
+
+async def _quit_quietly(client: "aiosmtplib.SMTP") -> None:
+    """Close an aiosmtplib connection, ignoring errors from a dead peer."""
+    try:
+        await client.quit()
+    except (aiosmtplib.SMTPException, OSError):
+        client.close()
+
+
+async def send_many_async(
+    messages: Iterable[dict], *, pool_size: int = 5, smtp_config: dict
+) -> list[bool]:
+    """
+    Send a batch of emails concurrently over a pool of SMTP connections.
+
+    Up to pool_size messages are in flight at once, each on its own
+    long-lived connection, so network round trips overlap instead of adding
+    up. Requires the optional aiosmtplib package.
+
+    Args:
+        messages: Iterable of message dicts (see EmailHelper.send_many)
+        pool_size: Maximum number of concurrent SMTP connections
+        smtp_config: Connection settings with the keyword arguments of
+            EmailHelper.setup_smtp (smtp_server, and optionally port,
+            username, password, use_tls, ssl_context and timeout)
+
+    Returns:
+        List with True/False per message, in input order
+    """
+    if aiosmtplib is None:
+        raise ImportError(
+            "send_many_async requires the aiosmtplib package; "
+            "install it with the 'async' extra: pip install py-utils[async]"
+        )
+
+    semaphore = asyncio.Semaphore(pool_size)
+    idle_clients: list = []
+
+    async def send_one(message: dict) -> bool:
+        # Build before borrowing a connection, so a malformed message dict
+        # fails without touching the pool
+        try:
+            msg = EmailHelper._build_message(**message)
+        except ValueError:
+            return False
+        sender, recipient = message["from_addr"], message["to_addr"]
+
+        async with semaphore:
+            # The semaphore caps concurrency, so at most pool_size
+            # connections are ever created
+            client = idle_clients.pop() if idle_clients else None
+            try:
+                if client is None:
+                    client = await _connect(smtp_config)
+                await client.send_message(msg, sender=sender, recipients=[recipient])
+            except BaseException as e:
+                # Drop the session without QUIT; it may be broken or hung
+                if client is not None:
+                    client.close()
+                if isinstance(e, (aiosmtplib.SMTPException, OSError)):
+                    return False
+                raise
+            idle_clients.append(client)
+            return True
+
+    # Let every send finish before closing the pool, even if one raised
+    try:
+        results = await asyncio.gather(
+            *(send_one(m) for m in messages), return_exceptions=True
+        )
+    finally:
+        for client in idle_clients:
+            await _quit_quietly(client)
+
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
@@ -1,14 +1,137 @@
+import heapq
 import os
-from datetime import datetime, timedelta
-from typing import Optional
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from typing import Iterable, Iterator, Optional
+
+
+def _scan_entries(
+    entries: Iterable[os.DirEntry], stack: list[str]
+) -> Iterator[tuple[str, float]]:
+    """Yield (path, mtime) for files in entries, pushing subdirectories onto stack."""
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            mtime = entry.stat(follow_symlinks=False).st_mtime
+        except OSError:
+            # Removed or unreadable since the directory was listed
+            continue
+        yield entry.path, mtime
+
+
+def _iter_files(
+    directory: str,
+    root_entries: Optional[Iterator[os.DirEntry]] = None,
+    first_entry: Optional[os.DirEntry] = None,
+) -> Iterator[tuple[str, float]]:
+    """
+    Recursively yield (path, mtime) for every regular file under directory.
+
+    Uses os.scandir so file type checks are served from the directory entry
+    instead of a separate stat call per path, leaving one lstat per file for
+    its mtime. Symlinks are not followed.
+
+    Subdirectories that cannot be read and files that vanish or cannot be
+    stat'ed during the walk are skipped.
+
+    An already open os.scandir() iterator for directory can be passed as
+    root_entries, with first_entry being the entry already taken from it.
+    """
+    stack = []
+    if root_entries is None:
+        stack.append(directory)
+    else:
+        with root_entries:
+            yield from _scan_entries(chain([first_entry], root_entries), stack)
+
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable or removed since it was listed: skip it
+            continue
+        with entries:
+            yield from _scan_entries(entries, stack)
+
+
+def _walk_nonempty(directory: str) -> Optional[Iterator[tuple[str, float]]]:
+    """
+    Return an _iter_files() walk of directory, or None if it is empty.
+
+    The scandir used to peek at the first entry is handed on to the walk, so
+    checking for an empty directory costs no extra directory read.
+    """
+    entries = os.scandir(directory)
+    first_entry = next(entries, None)
+    if first_entry is None:
+        entries.close()
+        return None
+    return _iter_files(directory, entries, first_entry)
+
+
+def _old_files(
+    files: Iterable[tuple[str, float]], cutoff_timestamp: float
+) -> Iterator[str]:
+    """Yield paths from (path, mtime) pairs modified before cutoff_timestamp."""
+    for file_path, mtime in files:
+        if mtime < cutoff_timestamp:
+            yield file_path
+
+
+def _check_directory(directory: str) -> str:
+    """Return directory as a string path, raising if it is not a directory."""
+    directory = os.fspath(directory)
+    if not os.path.isdir(directory):
+        if os.path.exists(directory):
+            raise NotADirectoryError(f"{directory} is not a directory")
+        raise FileNotFoundError(f"Directory {directory} does not exist")
+    return directory
+
+
+def _safe_unlink(file_path: str) -> bool:
+    """Delete a file, reporting failures instead of raising."""
+    try:
+        os.remove(file_path)
+        return True
+    except OSError as e:
+        print(f"Error deleting {file_path}: {e}")
+        return False
+
+
+def _delete_files(files: Iterable[str], max_workers: Optional[int] = None) -> int:
+    """
+    Delete files concurrently and return how many were removed.
+
+    unlink() releases the GIL, so a thread pool keeps many deletions in
+    flight at once instead of paying each syscall's latency in turn.
+    """
+    if max_workers is None:
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+    deleted_count = 0
+    files = iter(files)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit in bounded batches so a long stream of paths is never
+        # turned into pending futures all at once
+        while batch := list(islice(files, max_workers * 64)):
+            deleted_count += sum(executor.map(_safe_unlink, batch))
+    return deleted_count
 
 
 class Housekeeper:
     """A helper class for file housekeeping operations."""
 
     @staticmethod
-    def housekeep_by_age(directory: str, days_old: int, confirm: bool = False) -> int:
+    def housekeep_by_age(
+        directory: str,
+        days_old: int,
+        confirm: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> int:
         """
         Delete files older than the specified number of days based on modification time.
 
@@ -16,53 +139,63 @@ class Housekeeper:
             directory: Path to the directory
             days_old: Delete files older than this many days
             confirm: Whether to ask for confirmation
+            max_workers: Number of threads used for deletion
+                (default: min(32, 4 * CPU count))
 
         Returns:
             Number of files deleted
         """
-        if not os.path.exists(directory):
-            raise FileNotFoundError(f"Directory {directory} does not exist")
+        directory = _check_directory(directory)
+        return Housekeeper._housekeep_by_age_unchecked(
+            directory, days_old, confirm, max_workers
+        )
 
+    @staticmethod
+    def _housekeep_by_age_unchecked(
+        directory: str,
+        days_old: int,
+        confirm: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> int:
+        """housekeep_by_age() for a directory already validated by the caller."""
         # Calculate cutoff time
-        cutoff_time = datetime.now() - timedelta(days=days_old)
-        cutoff_timestamp = cutoff_time.timestamp()
+        cutoff_timestamp = time.time() - days_old * 86400.0
+
+        files = _walk_nonempty(directory)
+        if files is None:
+            print(f"No files older than {days_old} days found.")
+            return 0
 
-        # Get all files with their modification times
-        files_to_delete = []
-        for file_path in Path(directory).rglob("*"):
-            if file_path.is_file() and file_path.stat().st_mtime < cutoff_timestamp:
-                files_to_delete.append(file_path)
+        # Stream matching files so only the preview is held in memory
+        old_files = _old_files(files, cutoff_timestamp)
+        preview = list(islice(old_files, 6))
 
-        if not files_to_delete:
+        if not preview:
             print(f"No files older than {days_old} days found.")
             return 0
 
         if confirm:
-            print(
-                f"Will delete {len(files_to_delete)} files older than {days_old} days:"
-            )
-            for file in files_to_delete[:5]:  # Show first 5
+            if len(preview) <= 5:
+                print(f"Will delete {len(preview)} files older than {days_old} days:")
+            else:
+                print(f"Will delete files older than {days_old} days, including:")
+            for file in preview[:5]:  # Show first 5
                 print(f"  {file}")
-            if len(files_to_delete) > 5:
-                print(f"  ... and {len(files_to_delete) - 5} more")
+            if len(preview) > 5:
+                print("  ... and more")
             response = input("Proceed? (y/N): ")
             if response.lower() != "y":
                 print("Deletion cancelled.")
                 return 0
 
-        deleted_count = 0
-        for file_path in files_to_delete:
-            try:
-                os.remove(file_path)
-                deleted_count += 1
-            except Exception as e:
-                print(f"Error deleting {file_path}: {e}")
-
-        return deleted_count
+        return _delete_files(chain(preview, old_files), max_workers)
 
     @staticmethod
     def housekeep_by_count(
-        directory: str, keep_count: int, confirm: bool = False
+        directory: str,
+        keep_count: int,
+        confirm: bool = False,
+        max_workers: Optional[int] = None,
     ) -> int:
         """
         Keep only the N newest files in the directory based on modification time.
@@ -72,47 +205,65 @@ class Housekeeper:
             directory: Path to the directory
             keep_count: Number of newest files to keep
             confirm: Whether to ask for confirmation
+            max_workers: Number of threads used for deletion
+                (default: min(32, 4 * CPU count))
 
         Returns:
             Number of files deleted
         """
-        if not os.path.exists(directory):
-            raise FileNotFoundError(f"Directory {directory} does not exist")
-
-        # Get all files with their modification times
-        files = []
-        for file_path in Path(directory).rglob("*"):
-            if file_path.is_file():
-                files.append((file_path, file_path.stat().st_mtime))
+        directory = _check_directory(directory)
+        return Housekeeper._housekeep_by_count_unchecked(
+            directory, keep_count, confirm, max_workers
+        )
 
-        if len(files) <= keep_count:
-            print(f"Only {len(files)} files found, no deletion needed.")
+    @staticmethod
+    def _housekeep_by_count_unchecked(
+        directory: str,
+        keep_count: int,
+        confirm: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> int:
+        """housekeep_by_count() for a directory already validated by the caller."""
+        files = _walk_nonempty(directory)
+        if files is None:
+            print("Only 0 files found, no deletion needed.")
             return 0
 
-        # Sort by modification time (newest first)
-        files.sort(key=lambda x: x[1], reverse=True)
+        # Track the keep_count newest files in a min-heap of (mtime, path)
+        # so memory stays O(keep_count) regardless of directory size
+        newest = []
+        file_count = 0
+        for file_path, mtime in files:
+            file_count += 1
+            if len(newest) < keep_count:
+                heapq.heappush(newest, (mtime, file_path))
+            elif newest and mtime > newest[0][0]:
+                heapq.heapreplace(newest, (mtime, file_path))
+
+        if file_count <= keep_count:
+            print(f"Only {file_count} files found, no deletion needed.")
+            return 0
 
-        # Files to delete (beyond keep_count)
-        files_to_delete = files[keep_count:]
+        # Files to delete (beyond keep_count). Files newer than the oldest
+        # kept one are skipped so anything created since the scan survives.
+        kept = frozenset(file_path for _, file_path in newest)
+        oldest_kept = newest[0][0] if newest else float("inf")
+        files_to_delete = (
+            file_path
+            for file_path, mtime in _iter_files(directory)
+            if mtime <= oldest_kept and file_path not in kept
+        )
 
         if confirm:
             print(
-                f"Will delete {len(files_to_delete)} files, keeping {keep_count} newest."
+                f"Will delete {file_count - keep_count} files, keeping {keep_count} newest."
             )
             response = input("Proceed? (y/N): ")
             if response.lower() != "y":
                 print("Deletion cancelled.")
                 return 0
 
-        deleted_count = 0
-        for file_path, _ in files_to_delete:
-            try:
-                os.remove(file_path)
-                deleted_count += 1
-            except Exception as e:
-                print(f"Error deleting {file_path}: {e}")
-
-        return deleted_count
+        return _delete_files(files_to_delete, max_workers)
 
 
 # Convenience function
@@ -130,10 +281,11 @@ def cleanup_directory(
     Returns:
         Number of files deleted
     """
-    if days_old is not None:
-        return Housekeeper.housekeep_by_age(directory, days_old)
-    elif keep_count is not None:
-        return Housekeeper.housekeep_by_count(directory, keep_count)
-    else:
+    if days_old is None and keep_count is None:
         print("Specify days_old or keep_count")
         return 0
+
+    directory = _check_directory(directory)
+    if days_old is not None:
+        return Housekeeper._housekeep_by_age_unchecked(directory, days_old)
+    return Housekeeper._housekeep_by_count_unchecked(directory, keep_count)
@@ -1,9 +1,56 @@
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import queue
+import time
 from typing import Optional
 
 
+_DEFAULT_FORMAT = (
+    "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
+)
+# Same as the default minus the source location, which fast mode does not collect
+_FAST_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Background listeners doing the actual handler I/O, keyed by logger name
+_LISTENERS: dict[str, logging.handlers.QueueListener] = {}
+
+
+def _close_handler(handler: logging.Handler) -> None:
+    """Close a handler, including the target of a buffering MemoryHandler."""
+    # MemoryHandler.close() flushes and then drops its target, so grab it first
+    target = getattr(handler, "target", None)
+    handler.close()
+    if target is not None:
+        target.close()
+
+
+def _stop_listener(name: str) -> None:
+    """Stop the listener for a logger, draining its queue, and close its handlers."""
+    listener = _LISTENERS.pop(name, None)
+    if listener is None:
+        return
+    listener.stop()
+    for handler in listener.handlers:
+        _close_handler(handler)
+
+
+@functools.lru_cache(maxsize=1)
+def _today_log_file(base_dir: str, day: tuple[int, int, int]) -> str:
+    """Build the default log file path for a base directory and (year, month, day)."""
+    timestamp = "%04d%02d%02d" % day
+    return os.path.join(base_dir, "logs", f"app_{timestamp}.log")
+
+
+@atexit.register
+def _stop_all_listeners() -> None:
+    """Drain every queued record before the interpreter exits."""
+    for name in list(_LISTENERS):
+        _stop_listener(name)
+
+
 class Logger:
     """A helper class for setting up consistent logging across projects."""
 
@@ -12,26 +59,64 @@ class Logger:
         name: str = "app",
         level: int = logging.INFO,
         log_file: Optional[str] = None,
-        format_string: str = "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
+        format_string: str = _DEFAULT_FORMAT,
+        buffer_capacity: int = 1024,
+        flush_level: int = logging.ERROR,
+        fast: bool = False,
     ) -> logging.Logger:
         """
         Set up a logger with consistent formatting and file output.
 
+        The logger itself only enqueues records; console and file output is
+        done by a background QueueListener thread so callers never block on
+        I/O. Use flush_logger() to wait for queued records to be written.
+
         Args:
             name: Logger name
             level: Logging level (default: INFO)
             log_file: Optional log file path. If None, logs to console only
             format_string: Log format string
+            buffer_capacity: Number of records buffered before they are written
+                to the log file
+            flush_level: Records at or above this level flush the file buffer
+                immediately
+            fast: Skip collecting source location, thread and process info for
+                every record, which makes logging calls considerably cheaper.
+                Records then have no filename/lineno, so the default format
+                drops them. This changes module-level logging settings and so
+                affects every logger in the process.
 
         Returns:
             Configured logger instance
         """
         logger = logging.getLogger(name)
+
+        # Nothing to do if the logger is already set up identically
+        config = (level, log_file, format_string, buffer_capacity, flush_level, fast)
+        if (
+            logger.handlers
+            and name in _LISTENERS
+            and getattr(logger, "_pyutils_config", None) == config
+        ):
+            return logger
+
         logger.setLevel(level)
 
         # Remove existing handlers to avoid duplicates
+        _stop_listener(name)
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+            _close_handler(handler)
+
+        if fast:
+            # Avoid the stack walk in findCaller() and the per-record
+            # thread/process lookups when creating LogRecords
+            logging._srcfile = None
+            logging.logThreads = False
+            logging.logProcesses = False
+            logging.logMultiprocessing = False
+            if format_string == _DEFAULT_FORMAT:
+                format_string = _FAST_FORMAT
 
         # Create formatter
         formatter = logging.Formatter(format_string)
@@ -39,21 +124,59 @@ class Logger:
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+        handlers: list[logging.Handler] = [console_handler]
 
         # File handler (if specified)
         if log_file:
             # Create log directory if it doesn't exist
             log_dir = os.path.dirname(log_file)
-            if log_dir and not os.path.exists(log_dir):
-                os.makedirs(log_dir)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
 
             file_handler = logging.FileHandler(log_file)
             file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
+
+            # Buffer file output so records are written in batches rather
+            # than one write() per record. Buffered records are flushed on
+            # close, including by logging.shutdown() at interpreter exit.
+            buffered_handler = logging.handlers.MemoryHandler(
+                capacity=buffer_capacity,
+                flushLevel=flush_level,
+                target=file_handler,
+                flushOnClose=True,
+            )
+            handlers.append(buffered_handler)
+
+        # Hand records to a background thread that runs the real handlers
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        _LISTENERS[name] = listener
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        logger._pyutils_config = config
 
         return logger
 
+    @staticmethod
+    def flush_logger(name: str = "app") -> None:
+        """
+        Write out all records queued or buffered for a logger.
+
+        Args:
+            name: Logger name passed to setup_logger()
+        """
+        listener = _LISTENERS.get(name)
+        if listener is None:
+            return
+
+        # Stopping the listener processes everything already queued
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+        listener.start()
+
     @staticmethod
     def get_default_log_file(base_dir: Optional[str] = None) -> str:
         """
@@ -68,8 +191,9 @@ class Logger:
         if base_dir is None:
             base_dir = os.getcwd()
 
-        timestamp = datetime.now().strftime("%Y%m%d")
-        return os.path.join(base_dir, "logs", f"app_{timestamp}.log")
+        # Key the cache on the cheap local date tuple; the date stamp and
+        # path are only rebuilt when the date or base_dir changes
+        return _today_log_file(base_dir, time.localtime()[:3])
 
 
 # Convenience function for quick setup
@@ -1,6 +1,46 @@
 import pytest
+import re
+import smtplib
+import socket
+import threading
+from contextlib import contextmanager
+from email import message_from_bytes
 from unittest.mock import Mock, patch
-from py_utils.email_helper import EmailHelper, send_quick_email
+from py_utils.email_helper import (
+    BatchAborted,
+    EmailHelper,
+    EmailSendError,
+    SMTPSetupError,
+    SMTPTimeoutError,
+    send_quick_email,
+    send_quick_many,
+)
+
+
+@contextmanager
+def _stalled_smtp_server(greet=True):
+    """Yield the port of a local server that stops responding mid-session."""
+    listener = socket.create_server(("127.0.0.1", 0))
+    accepted = []
+
+    def serve():
+        try:
+            conn, _ = listener.accept()
+        except OSError:
+            return
+        accepted.append(conn)
+        if greet:
+            conn.sendall(b"220 test ESMTP\r\n")
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    try:
+        yield listener.getsockname()[1]
+    finally:
+        listener.close()
+        thread.join(timeout=1)
+        for conn in accepted:
+            conn.close()
 
 
 class TestEmailHelper:
@@ -15,7 +55,7 @@ class TestEmailHelper:
             result = EmailHelper.setup_smtp("smtp.example.com", 25)
 
             assert result == mock_server
-            mock_smtp.assert_called_once_with("smtp.example.com", 25)
+            mock_smtp.assert_called_once_with("smtp.example.com", 25, timeout=30.0)
 
     def test_setup_smtp_with_tls(self):
         """Test SMTP setup with TLS encryption."""
@@ -34,6 +74,20 @@ class TestEmailHelper:
             # SSL context should be passed
             assert "context" in call_args[1]
 
+    def test_setup_smtp_reuses_ssl_context(self):
+        """Test that TLS connections share one default SSL context."""
+        with patch("smtplib.SMTP_SSL") as mock_smtp_ssl:
+            EmailHelper.setup_smtp("smtp.example.com", 465, use_tls=True)
+            EmailHelper.setup_smtp("smtp.example.com", 465, use_tls=True)
+            custom_context = Mock()
+            EmailHelper.setup_smtp(
+                "smtp.example.com", 465, use_tls=True, ssl_context=custom_context
+            )
+
+            contexts = [c[1]["context"] for c in mock_smtp_ssl.call_args_list]
+            assert contexts[0] is contexts[1]
+            assert contexts[2] is custom_context
+
     def test_setup_smtp_with_auth(self):
         """Test SMTP setup with authentication."""
         with patch("smtplib.SMTP") as mock_smtp:
@@ -55,9 +109,19 @@ class TestEmailHelper:
         with patch("smtplib.SMTP") as mock_smtp:
             mock_smtp.side_effect = Exception("Connection failed")
 
-            with pytest.raises(Exception, match="Failed to setup SMTP connection"):
+            with pytest.raises(
+                SMTPSetupError, match="Failed to setup SMTP connection"
+            ) as exc_info:
                 EmailHelper.setup_smtp("smtp.example.com", 25)
 
+            assert str(exc_info.value.__cause__) == "Connection failed"
+
+    def test_setup_smtp_timeout(self):
+        """Test that a server that never greets raises SMTPTimeoutError."""
+        with _stalled_smtp_server(greet=False) as port:
+            with pytest.raises(SMTPTimeoutError):
+                EmailHelper.setup_smtp("127.0.0.1", port, timeout=0.2)
+
     def test_send_email_basic(self):
         """Test basic email sending functionality."""
         mock_server = Mock()
@@ -71,10 +135,12 @@ class TestEmailHelper:
         )
 
         assert result is True
-        mock_server.sendmail.assert_called_once()
-        args = mock_server.sendmail.call_args[0]
-        assert args[0] == "sender@example.com"
-        assert args[1] == "recipient@example.com"
+        mock_server.send_message.assert_called_once()
+        msg, from_addr, to_addr = mock_server.send_message.call_args[0]
+        assert from_addr == "sender@example.com"
+        assert to_addr == "recipient@example.com"
+        assert not msg.is_multipart()
+        assert msg.get_content().strip() == "Test Body"
 
     def test_send_email_with_html(self):
         """Test sending email with HTML body."""
@@ -90,14 +156,52 @@ class TestEmailHelper:
         )
 
         assert result is True
-        mock_server.sendmail.assert_called_once()
+        mock_server.send_message.assert_called_once()
+        msg = mock_server.send_message.call_args[0][0]
+        assert msg.get_content_type() == "multipart/alternative"
+        assert len(msg.get_payload()) == 2
+
+    def test_send_email_non_ascii_body(self):
+        """Test that non-ASCII plain text bodies are sent 7-bit clean."""
+        mock_server = Mock()
+
+        EmailHelper.send_email(
+            server=mock_server,
+            from_addr="sender@example.com",
+            to_addr="recipient@example.com",
+            subject="Test Subject",
+            body="Grüße aus München",
+        )
+
+        msg = mock_server.send_message.call_args[0][0]
+        assert msg["Content-Transfer-Encoding"] == "quoted-printable"
+        assert msg.as_bytes().isascii()
+        assert msg.get_content().strip() == "Grüße aus München"
+
+    def test_send_email_rejects_header_line_breaks(self):
+        """Test that line breaks in headers are rejected with or without HTML."""
+        mock_server = Mock()
+
+        for html_body in (None, "<h1>HTML Body</h1>"):
+            with pytest.raises(EmailSendError) as exc_info:
+                EmailHelper.send_email(
+                    server=mock_server,
+                    from_addr="sender@example.com",
+                    to_addr="recipient@example.com",
+                    subject="Hi\r\nBcc: victim@example.com",
+                    body="Test Body",
+                    html_body=html_body,
+                )
+            assert isinstance(exc_info.value.__cause__, ValueError)
+
+        mock_server.send_message.assert_not_called()
 
     def test_send_email_failure(self):
         """Test email sending failure handling."""
         mock_server = Mock()
-        mock_server.sendmail.side_effect = Exception("Send failed")
+        mock_server.send_message.side_effect = Exception("Send failed")
 
-        with pytest.raises(Exception, match="Failed to send email"):
+        with pytest.raises(EmailSendError, match="Failed to send email") as exc_info:
             EmailHelper.send_email(
                 server=mock_server,
                 from_addr="sender@example.com",
@@ -106,6 +210,196 @@ class TestEmailHelper:
                 body="Test Body",
             )
 
+        assert str(exc_info.value.__cause__) == "Send failed"
+
+    def test_send_email_timeout(self):
+        """Test that a server going silent mid-send raises SMTPTimeoutError."""
+        with _stalled_smtp_server() as port:
+            server = EmailHelper.setup_smtp("127.0.0.1", port, timeout=0.2)
+
+            with pytest.raises(SMTPTimeoutError):
+                EmailHelper.send_email(
+                    server=server,
+                    from_addr="sender@example.com",
+                    to_addr="recipient@example.com",
+                    subject="Test Subject",
+                    body="Test Body",
+                )
+
+        # Server should be closed, without waiting on QUIT
+        assert server.sock is None
+
+    def test_send_prepared(self):
+        """Test sending a pre-serialized template to several recipients."""
+        mock_server = Mock()
+        template = EmailHelper.prepare_template(
+            from_addr="sender@example.com",
+            subject="Test Subject",
+            body="Test Body",
+            html_body="<h1>HTML Body</h1>",
+        )
+
+        for recipient in ("a@example.com", "b@example.com"):
+            result = EmailHelper.send_prepared(
+                mock_server, "sender@example.com", recipient, template
+            )
+            assert result is True
+
+        assert mock_server.sendmail.call_count == 2
+        from_addr, to_addrs, payload = mock_server.sendmail.call_args[0]
+        assert from_addr == "sender@example.com"
+        assert to_addrs == ["b@example.com"]
+        msg = message_from_bytes(payload)
+        assert msg["To"] == "b@example.com"
+        assert msg["Subject"] == "Test Subject"
+        assert b"__PLACEHOLDER__" not in payload
+
+    def test_prepare_template_uses_crlf(self):
+        """Test that templates have only CRLF line endings, as SMTP requires."""
+        for html_body in (None, "<h1>HTML Body</h1>"):
+            template = EmailHelper.prepare_template(
+                from_addr="sender@example.com",
+                subject="Test Subject",
+                body="Line one\nLine two\n",
+                html_body=html_body,
+            )
+
+            assert b"\r\n" in template
+            assert re.search(rb"(?<!\r)\n", template) is None
+
+    def test_send_prepared_rejects_header_injection(self):
+        """Test that recipients containing line breaks are rejected."""
+        mock_server = Mock()
+        template = EmailHelper.prepare_template(
+            "sender@example.com", "Test Subject", "Test Body"
+        )
+
+        with pytest.raises(ValueError):
+            EmailHelper.send_prepared(
+                mock_server,
+                "sender@example.com",
+                "a@example.com\r\nBcc: victim@example.com",
+                template,
+            )
+        mock_server.sendmail.assert_not_called()
+
+    def test_send_prepared_only_replaces_to_header(self):
+        """Test that a subject quoting the placeholder is not rewritten."""
+        mock_server = Mock()
+        for html_body in (None, "<h1>HTML Body</h1>"):
+            template = EmailHelper.prepare_template(
+                from_addr="sender@example.com",
+                subject="To: __PLACEHOLDER__",
+                body="Test Body",
+                html_body=html_body,
+            )
+
+            EmailHelper.send_prepared(
+                mock_server, "sender@example.com", "a@example.com", template
+            )
+
+            msg = message_from_bytes(mock_server.sendmail.call_args[0][2])
+            assert msg["To"] == "a@example.com"
+            assert msg["Subject"] == "To: __PLACEHOLDER__"
+
+    def test_send_prepared_non_ascii_recipient(self):
+        """Test that non-ASCII names are encoded and mailboxes rejected."""
+        mock_server = Mock()
+        template = EmailHelper.prepare_template(
+            "sender@example.com", "Test Subject", "Test Body"
+        )
+
+        EmailHelper.send_prepared(
+            mock_server, "sender@example.com", "José <jose@example.com>", template
+        )
+        payload = mock_server.sendmail.call_args[0][2]
+        assert payload.isascii()
+        assert b"To: =?utf-8?q?Jos=C3=A9?= <jose@example.com>\r\n" in payload
+
+        mock_server.reset_mock()
+        with pytest.raises(ValueError):
+            EmailHelper.send_prepared(
+                mock_server, "sender@example.com", "josé@example.com", template
+            )
+        mock_server.sendmail.assert_not_called()
+
+    def test_send_many_basic(self):
+        """Test sending a batch over one session."""
+        mock_server = Mock()
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": f"user{i}@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+            for i in range(3)
+        ]
+
+        results = EmailHelper.send_many(mock_server, messages)
+
+        assert results == [True, True, True]
+        assert mock_server.send_message.call_count == 3
+        args = mock_server.send_message.call_args[0]
+        assert args[1] == "sender@example.com"
+        assert args[2] == "user2@example.com"
+
+    def test_send_many_records_failures(self):
+        """Test that individual failures are recorded without raising."""
+        mock_server = Mock()
+        mock_server.send_message.side_effect = [
+            None,
+            smtplib.SMTPRecipientsRefused({}),
+            None,
+        ]
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 3
+
+        results = EmailHelper.send_many(mock_server, messages)
+
+        assert results == [True, False, True]
+
+    def test_send_many_records_invalid_message(self):
+        """Test that a message that cannot be built is recorded as failed."""
+        mock_server = Mock()
+        message = {
+            "from_addr": "sender@example.com",
+            "to_addr": "recipient@example.com",
+            "subject": "Test Subject",
+            "body": "Test Body",
+        }
+        messages = [message, {**message, "subject": "Bad\nSubject"}, message]
+
+        results = EmailHelper.send_many(mock_server, messages)
+
+        assert results == [True, False, True]
+        assert mock_server.send_message.call_count == 2
+
+    def test_send_many_aborts_on_failure_threshold(self):
+        """Test that the batch aborts once too many sends have failed."""
+        mock_server = Mock()
+        mock_server.send_message.side_effect = smtplib.SMTPDataError(554, b"Rejected")
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 10
+
+        with pytest.raises(BatchAborted) as exc_info:
+            EmailHelper.send_many(mock_server, messages, min_batch_for_abort=4)
+
+        assert exc_info.value.results == [False] * 4
+        assert mock_server.send_message.call_count == 4
+
 
 class TestSendQuickEmail:
     """Test cases for the send_quick_email convenience function."""
@@ -127,7 +421,9 @@ class TestSendQuickEmail:
         )
 
         assert result is True
-        mock_setup.assert_called_once_with("smtp.example.com", 25, None, None, False)
+        mock_setup.assert_called_once_with(
+            "smtp.example.com", 25, None, None, False, timeout=30.0
+        )
         mock_send.assert_called_once()
         mock_server.quit.assert_called_once()
 
@@ -152,7 +448,12 @@ class TestSendQuickEmail:
 
         assert result is True
         mock_setup.assert_called_once_with(
-            "smtp.example.com", 25, "user@example.com", "password123", True
+            "smtp.example.com",
+            25,
+            "user@example.com",
+            "password123",
+            True,
+            timeout=30.0,
         )
 
     @patch("py_utils.email_helper.EmailHelper.setup_smtp")
@@ -172,5 +473,210 @@ class TestSendQuickEmail:
                 body="Test Body",
             )
 
-        # Server should still be closed
+        # Server should still be closed, without waiting on QUIT
+        mock_server.close.assert_called_once()
+        mock_server.quit.assert_not_called()
+
+    def test_send_quick_email_timeout(self):
+        """Test that a send timeout surfaces as SMTPTimeoutError."""
+        with _stalled_smtp_server() as port:
+            with pytest.raises(SMTPTimeoutError):
+                send_quick_email(
+                    smtp_server="127.0.0.1",
+                    from_addr="sender@example.com",
+                    to_addr="recipient@example.com",
+                    subject="Test Subject",
+                    body="Test Body",
+                    port=port,
+                    timeout=0.2,
+                )
+
+
+class TestSmtpPool:
+    """Test cases for pooled SMTP connections."""
+
+    def setup_method(self):
+        EmailHelper.close_all()
+
+    def teardown_method(self):
+        EmailHelper.close_all()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_connection_reused(self, mock_setup):
+        """Test that a released connection is handed out again."""
+        mock_server = Mock()
+        mock_server.noop.return_value = (250, b"OK")
+        mock_setup.return_value = mock_server
+
+        first = EmailHelper.get_or_create_smtp("smtp.example.com", 25)
+        EmailHelper.release_smtp(first)
+        second = EmailHelper.get_or_create_smtp("smtp.example.com", 25)
+
+        assert first is second
+        mock_setup.assert_called_once()
+        mock_server.noop.assert_called_once()
+        mock_server.quit.assert_not_called()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_dead_connection_replaced(self, mock_setup):
+        """Test that a connection failing the NOOP health check is replaced."""
+        dead_server = Mock()
+        dead_server.noop.side_effect = smtplib.SMTPServerDisconnected()
+        dead_server.quit.side_effect = smtplib.SMTPServerDisconnected()
+        fresh_server = Mock()
+        mock_setup.side_effect = [dead_server, fresh_server]
+
+        EmailHelper.release_smtp(EmailHelper.get_or_create_smtp("smtp.example.com"))
+        server = EmailHelper.get_or_create_smtp("smtp.example.com")
+
+        assert server is fresh_server
+        dead_server.close.assert_called_once()
+        dead_server.quit.assert_not_called()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_discarded_connection_closed_without_quit(self, mock_setup):
+        """Test that discarding a connection closes it without QUIT."""
+        mock_server = Mock()
+        mock_setup.return_value = mock_server
+
+        server = EmailHelper.get_or_create_smtp("smtp.example.com")
+        EmailHelper.release_smtp(server, discard=True)
+
+        mock_server.close.assert_called_once()
+        mock_server.quit.assert_not_called()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_connection_recycled_after_max_messages(self, mock_setup):
+        """Test that a connection is closed once it reaches the message limit."""
+        mock_server = Mock()
+        mock_setup.return_value = mock_server
+
+        server = EmailHelper.get_or_create_smtp("smtp.example.com")
+        EmailHelper.release_smtp(server, messages_sent=2, max_messages_per_connection=2)
+
         mock_server.quit.assert_called_once()
+        EmailHelper.get_or_create_smtp("smtp.example.com")
+        assert mock_setup.call_count == 2
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    @patch("py_utils.email_helper.EmailHelper.send_email")
+    def test_send_quick_email_reuse(self, mock_send, mock_setup):
+        """Test that send_quick_email with reuse keeps the connection open."""
+        mock_server = Mock()
+        mock_server.noop.return_value = (250, b"OK")
+        mock_setup.return_value = mock_server
+        mock_send.return_value = True
+
+        for _ in range(3):
+            assert send_quick_email(
+                smtp_server="smtp.example.com",
+                from_addr="sender@example.com",
+                to_addr="recipient@example.com",
+                subject="Test Subject",
+                body="Test Body",
+                reuse=True,
+            )
+
+        mock_setup.assert_called_once()
+        assert mock_send.call_count == 3
+        mock_server.quit.assert_not_called()
+
+        EmailHelper.close_all()
+        mock_server.quit.assert_called_once()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_send_quick_many(self, mock_setup):
+        """Test that send_quick_many sends the batch over a pooled connection."""
+        mock_server = Mock()
+        mock_setup.return_value = mock_server
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 2
+
+        results = send_quick_many("smtp.example.com", messages)
+
+        assert results == [True, True]
+        assert mock_server.send_message.call_count == 2
+        mock_server.quit.assert_not_called()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_send_quick_many_recycles_connections(self, mock_setup):
+        """Test that a batch is split across connections at the message limit."""
+        servers = [Mock() for _ in range(3)]
+        for server in servers:
+            server.noop.return_value = (250, b"OK")
+        mock_setup.side_effect = servers
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 5
+
+        results = send_quick_many(
+            "smtp.example.com", messages, max_messages_per_connection=2
+        )
+
+        assert results == [True] * 5
+        assert [s.send_message.call_count for s in servers] == [2, 2, 1]
+        servers[0].quit.assert_called_once()
+        servers[1].quit.assert_called_once()
+        servers[2].quit.assert_not_called()
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_send_quick_many_abort_across_connections(self, mock_setup):
+        """Test that the abort threshold applies to the whole batch."""
+        mock_server = Mock()
+        mock_server.send_message.side_effect = [None, None, None] + [
+            smtplib.SMTPDataError(554, b"Rejected")
+        ] * 3
+        mock_setup.return_value = mock_server
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 10
+
+        with pytest.raises(BatchAborted) as exc_info:
+            send_quick_many(
+                "smtp.example.com",
+                messages,
+                max_messages_per_connection=3,
+                abort_threshold=0.4,
+                min_batch_for_abort=5,
+            )
+
+        assert exc_info.value.results == [True, True, True, False, False, False]
+
+    @patch("py_utils.email_helper.EmailHelper.setup_smtp")
+    def test_send_quick_many_abort_uses_whole_batch_rate(self, mock_setup):
+        """Test that a chunk's own failure rate does not abort the batch."""
+        mock_server = Mock()
+        mock_server.noop.return_value = (250, b"OK")
+        mock_server.send_message.side_effect = [None] * 100 + [
+            smtplib.SMTPDataError(554, b"Rejected")
+        ] * 30
+        mock_setup.return_value = mock_server
+        messages = [
+            {
+                "from_addr": "sender@example.com",
+                "to_addr": "recipient@example.com",
+                "subject": "Test Subject",
+                "body": "Test Body",
+            }
+        ] * 130
+
+        # 30 of 130 failed is below the default 1/3 threshold
+        results = send_quick_many("smtp.example.com", messages)
+
+        assert results == [True] * 100 + [False] * 30
@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from py_utils import email_helper_async
+from py_utils.email_helper_async import send_many_async
+
+
+def _messages(count):
+    return [
+        {
+            "from_addr": "sender@example.com",
+            "to_addr": f"user{i}@example.com",
+            "subject": "Test Subject",
+            "body": "Test Body",
+        }
+        for i in range(count)
+    ]
+
+
+def _client():
+    """Build a stand-in aiosmtplib.SMTP client; close() is synchronous."""
+    client = AsyncMock()
+    client.close = Mock()
+    return client
+
+
+def _mock_aiosmtplib(clients):
+    """Build a stand-in aiosmtplib module handing out the given clients."""
+    module = Mock()
+    module.SMTPException = type("SMTPException", (Exception,), {})
+    module.SMTP.side_effect = clients
+    return module
+
+
+class TestSendManyAsync:
+    """Test cases for the send_many_async function."""
+
+    def test_send_many_async_basic(self):
+        """Test that messages are sent over at most pool_size connections."""
+        async def yield_to_loop(*args, **kwargs):
+            # Let other sends run so they actually overlap
+            await asyncio.sleep(0)
+
+        clients = [_client() for _ in range(2)]
+        for client in clients:
+            client.send_message.side_effect = yield_to_loop
+        with patch.object(email_helper_async, "aiosmtplib", _mock_aiosmtplib(clients)):
+            results = asyncio.run(
+                send_many_async(
+                    _messages(6),
+                    pool_size=2,
+                    smtp_config={"smtp_server": "smtp.example.com"},
+                )
+            )
+
+        assert results == [True] * 6
+        assert sum(c.send_message.await_count for c in clients) == 6
+        for client in clients:
+            client.connect.assert_awaited_once()
+            client.login.assert_not_awaited()
+            client.quit.assert_awaited_once()
+
+    def test_send_many_async_with_auth(self):
+        """Test that connections authenticate when credentials are given."""
+        client = _client()
+        with patch.object(email_helper_async, "aiosmtplib", _mock_aiosmtplib([client])):
+            asyncio.run(
+                send_many_async(
+                    _messages(1),
+                    pool_size=1,
+                    smtp_config={
+                        "smtp_server": "smtp.example.com",
+                        "username": "user@example.com",
+                        "password": "password123",
+                    },
+                )
+            )
+
+        client.login.assert_awaited_once_with("user@example.com", "password123")
+
+    def test_send_many_async_failure(self):
+        """Test that a failed send is recorded and its connection replaced."""
+        module = _mock_aiosmtplib([])
+        failing, healthy = _client(), _client()
+        failing.send_message.side_effect = module.SMTPException("Rejected")
+        module.SMTP.side_effect = [failing, healthy]
+
+        with patch.object(email_helper_async, "aiosmtplib", module):
+            results = asyncio.run(
+                send_many_async(
+                    _messages(2),
+                    pool_size=1,
+                    smtp_config={"smtp_server": "smtp.example.com"},
+                )
+            )
+
+        assert results == [False, True]
+        failing.close.assert_called_once()
+        failing.quit.assert_not_awaited()
+        healthy.send_message.assert_awaited_once()
+
+    def test_send_many_async_login_failure_closes_client(self):
+        """Test that a connection whose login fails is closed."""
+        module = _mock_aiosmtplib([])
+        client = _client()
+        client.login.side_effect = module.SMTPException("Auth failed")
+        module.SMTP.side_effect = [client]
+
+        with patch.object(email_helper_async, "aiosmtplib", module):
+            results = asyncio.run(
+                send_many_async(
+                    _messages(1),
+                    smtp_config={
+                        "smtp_server": "smtp.example.com",
+                        "username": "user@example.com",
+                        "password": "wrong",
+                    },
+                )
+            )
+
+        assert results == [False]
+        client.close.assert_called_once()
+
+    def test_send_many_async_malformed_message(self):
+        """Test that a malformed message raises after the other sends finish."""
+        client = _client()
+        messages = _messages(3)
+        del messages[1]["to_addr"]
+
+        with patch.object(email_helper_async, "aiosmtplib", _mock_aiosmtplib([client])):
+            with pytest.raises(TypeError):
+                asyncio.run(
+                    send_many_async(
+                        messages,
+                        pool_size=1,
+                        smtp_config={"smtp_server": "smtp.example.com"},
+                    )
+                )
+
+        assert client.send_message.await_count == 2
+        client.quit.assert_awaited_once()
+
+    def test_send_many_async_requires_aiosmtplib(self):
+        """Test that a missing aiosmtplib raises an informative ImportError."""
+        with patch.object(email_helper_async, "aiosmtplib", None):
+            with pytest.raises(ImportError, match="aiosmtplib"):
+                asyncio.run(
+                    send_many_async(
+                        _messages(1), smtp_config={"smtp_server": "smtp.example.com"}
+                    )
+                )
@@ -1,8 +1,8 @@
+import os
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import patch, MagicMock
-from pathlib import Path
-from py_utils.housekeeper import Housekeeper, cleanup_directory
+from unittest.mock import patch
+from py_utils.housekeeper import Housekeeper, _scan_entries, cleanup_directory
 
 
 class TestHousekeeper:
@@ -17,6 +17,17 @@ class TestHousekeeper:
         result = Housekeeper.housekeep_by_age(str(empty_dir), days_old=7, confirm=False)
         assert result == 0
 
+    def test_empty_directory_skips_walk(self, tmp_path):
+        """Test that an empty directory returns before walking the tree."""
+        empty_dir = tmp_path / "empty"
+        empty_dir.mkdir()
+
+        with patch("py_utils.housekeeper._iter_files") as mock_iter_files:
+            assert Housekeeper.housekeep_by_age(str(empty_dir), days_old=7) == 0
+            assert Housekeeper.housekeep_by_count(str(empty_dir), keep_count=0) == 0
+
+        mock_iter_files.assert_not_called()
+
     def test_housekeep_by_age_recent_files(self, tmp_path):
         """Test housekeep_by_age with only recent files."""
         test_dir = tmp_path / "test_recent"
@@ -44,24 +55,110 @@ class TestHousekeeper:
         old_file = test_dir / "old.txt"
         old_file.write_text("test content")
 
-        # Mock the file modification time to be old (10 days ago)
+        # Set the file modification time to be old (10 days ago)
+        old_timestamp = (datetime.now() - timedelta(days=10)).timestamp()
+        os.utime(old_file, (old_timestamp, old_timestamp))
+
+        with patch("os.remove") as mock_remove:
+            result = Housekeeper.housekeep_by_age(
+                str(test_dir), days_old=7, confirm=False
+            )
+
+            # Should delete old files
+            mock_remove.assert_called_once_with(str(old_file))
+            assert result == 1
+
+    def test_housekeep_by_age_nested_files(self, tmp_path):
+        """Test housekeep_by_age removes old files in subdirectories."""
+        test_dir = tmp_path / "test_nested"
+        nested_dir = test_dir / "a" / "b"
+        nested_dir.mkdir(parents=True)
+
+        old_timestamp = (datetime.now() - timedelta(days=10)).timestamp()
+        old_file = nested_dir / "old.txt"
+        old_file.write_text("test content")
+        os.utime(old_file, (old_timestamp, old_timestamp))
+        recent_file = test_dir / "recent.txt"
+        recent_file.write_text("test content")
+
+        result = Housekeeper.housekeep_by_age(str(test_dir), days_old=7, confirm=False)
+
+        assert result == 1
+        assert not old_file.exists()
+        assert recent_file.exists()
+        assert nested_dir.exists()
+
+    def test_housekeep_by_age_confirm(self, tmp_path, capsys):
+        """Test housekeep_by_age previews files and honours the answer."""
+        test_dir = tmp_path / "test_confirm"
+        test_dir.mkdir()
+        old_timestamp = (datetime.now() - timedelta(days=10)).timestamp()
+        for i in range(8):
+            file_path = test_dir / f"old_{i}.txt"
+            file_path.write_text(f"content {i}")
+            os.utime(file_path, (old_timestamp, old_timestamp))
+
+        with patch("builtins.input", return_value="n"):
+            result = Housekeeper.housekeep_by_age(
+                str(test_dir), days_old=7, confirm=True
+            )
+
+        assert result == 0
+        captured = capsys.readouterr().out
+        assert captured.count("old_") == 5
+        assert "... and more" in captured
+        assert "Deletion cancelled." in captured
+        assert len(list(test_dir.iterdir())) == 8
+
+        with patch("builtins.input", return_value="y"):
+            result = Housekeeper.housekeep_by_age(
+                str(test_dir), days_old=7, confirm=True
+            )
+
+        assert result == 8
+        assert not any(test_dir.iterdir())
+
+    def test_housekeep_by_age_unreadable_subdirectory(self, tmp_path):
+        """Test that unreadable subdirectories are skipped, not fatal."""
+        test_dir = tmp_path / "test_unreadable"
+        locked_dir = test_dir / "locked"
+        locked_dir.mkdir(parents=True)
         old_timestamp = (datetime.now() - timedelta(days=10)).timestamp()
+        for file_path in (test_dir / "old.txt", locked_dir / "hidden.txt"):
+            file_path.write_text("test content")
+            os.utime(file_path, (old_timestamp, old_timestamp))
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == str(locked_dir):
+                raise PermissionError("denied")
+            return real_scandir(path)
 
-        with patch.object(Path, "rglob") as mock_rglob:
-            mock_file = MagicMock()
-            mock_file.is_file.return_value = True
-            mock_file.stat.return_value.st_mtime = old_timestamp
-            mock_file.__str__ = lambda: str(old_file)
-            mock_rglob.return_value = [mock_file]
+        with patch("os.scandir", side_effect=scandir):
+            result = Housekeeper.housekeep_by_age(
+                str(test_dir), days_old=7, confirm=False
+            )
+
+        assert result == 1
+        assert not (test_dir / "old.txt").exists()
+        assert (locked_dir / "hidden.txt").exists()
+
+    def test_scan_skips_file_removed_after_listing(self, tmp_path):
+        """Test that a file removed between listing and stat is skipped."""
+        for i in range(3):
+            (tmp_path / f"file_{i}.txt").write_text(f"content {i}")
 
-            with patch("os.remove") as mock_remove:
-                result = Housekeeper.housekeep_by_age(
-                    str(test_dir), days_old=7, confirm=False
-                )
+        with os.scandir(tmp_path) as it:
+            entries = list(it)
+        (tmp_path / "file_1.txt").unlink()
 
-                # Should delete old files
-                mock_remove.assert_called_once()
-                assert result == 1
+        files = [path for path, _ in _scan_entries(entries, [])]
+
+        assert sorted(files) == [
+            str(tmp_path / "file_0.txt"),
+            str(tmp_path / "file_2.txt"),
+        ]
 
     def test_housekeep_by_age_invalid_directory(self):
         """Test housekeep_by_age with invalid directory."""
@@ -107,26 +204,53 @@ class TestHousekeeper:
             file_path = test_dir / f"file_{i}.txt"
             file_path.write_text(f"content {i}")
 
-        with patch.object(Path, "rglob") as mock_rglob:
-            mock_files = []
-            for i in range(7):
-                mock_file = MagicMock()
-                mock_file.is_file.return_value = True
-                mock_file.stat.return_value.st_mtime = (
-                    datetime.now().timestamp() - i * 3600
-                )
-                mock_file.__str__ = lambda i=i: str(test_dir / f"file_{i}.txt")
-                mock_files.append(mock_file)
-            mock_rglob.return_value = mock_files
-
-            with patch("os.remove") as mock_remove:
-                result = Housekeeper.housekeep_by_count(
-                    str(test_dir), keep_count=3, confirm=False
-                )
-
-                # Should delete 4 oldest files (keep 3 newest)
-                assert mock_remove.call_count == 4
-                assert result == 4
+        # Give each file a distinct modification time, file_0 being the newest
+        now = datetime.now().timestamp()
+        for i in range(7):
+            file_path = test_dir / f"file_{i}.txt"
+            os.utime(file_path, (now - i * 3600, now - i * 3600))
+
+        with patch("os.remove") as mock_remove:
+            result = Housekeeper.housekeep_by_count(
+                str(test_dir), keep_count=3, confirm=False
+            )
+
+            # Should delete 4 oldest files (keep 3 newest)
+            assert mock_remove.call_count == 4
+            assert result == 4
+            deleted = {call.args[0] for call in mock_remove.call_args_list}
+            assert deleted == {str(test_dir / f"file_{i}.txt") for i in range(3, 7)}
+
+    def test_housekeep_by_count_keep_none(self, tmp_path):
+        """Test housekeep_by_count with keep_count=0 deletes every file."""
+        test_dir = tmp_path / "test_keep_none"
+        nested_dir = test_dir / "nested"
+        nested_dir.mkdir(parents=True)
+        (test_dir / "a.txt").write_text("a")
+        (nested_dir / "b.txt").write_text("b")
+
+        result = Housekeeper.housekeep_by_count(
+            str(test_dir), keep_count=0, confirm=False
+        )
+
+        assert result == 2
+        assert not any(p.is_file() for p in test_dir.rglob("*"))
+
+    def test_housekeep_by_count_delete_error(self, tmp_path, capsys):
+        """Test that failed deletions are reported and not counted."""
+        test_dir = tmp_path / "test_delete_error"
+        test_dir.mkdir()
+        for i in range(4):
+            (test_dir / f"file_{i}.txt").write_text(f"content {i}")
+
+        with patch("os.remove") as mock_remove:
+            mock_remove.side_effect = [None, PermissionError("denied"), None, None]
+            result = Housekeeper.housekeep_by_count(
+                str(test_dir), keep_count=0, confirm=False, max_workers=1
+            )
+
+        assert result == 3
+        assert "Error deleting" in capsys.readouterr().out
 
     def test_housekeep_by_count_invalid_directory(self):
         """Test housekeep_by_count with invalid directory."""
@@ -137,24 +261,24 @@ class TestHousekeeper:
 class TestCleanupDirectory:
     """Test cases for the cleanup_directory convenience function."""
 
-    @patch("py_utils.housekeeper.Housekeeper.housekeep_by_age")
-    def test_cleanup_directory_by_age(self, mock_housekeep_age):
+    @patch("py_utils.housekeeper.Housekeeper._housekeep_by_age_unchecked")
+    def test_cleanup_directory_by_age(self, mock_housekeep_age, tmp_path):
         """Test cleanup_directory with age-based cleanup."""
         mock_housekeep_age.return_value = 5
 
-        result = cleanup_directory("/test/dir", days_old=7)
+        result = cleanup_directory(str(tmp_path), days_old=7)
 
-        mock_housekeep_age.assert_called_once_with("/test/dir", 7)
+        mock_housekeep_age.assert_called_once_with(str(tmp_path), 7)
         assert result == 5
 
-    @patch("py_utils.housekeeper.Housekeeper.housekeep_by_count")
-    def test_cleanup_directory_by_count(self, mock_housekeep_count):
+    @patch("py_utils.housekeeper.Housekeeper._housekeep_by_count_unchecked")
+    def test_cleanup_directory_by_count(self, mock_housekeep_count, tmp_path):
         """Test cleanup_directory with count-based cleanup."""
         mock_housekeep_count.return_value = 3
 
-        result = cleanup_directory("/test/dir", keep_count=5)
+        result = cleanup_directory(tmp_path, keep_count=5)
 
-        mock_housekeep_count.assert_called_once_with("/test/dir", 5)
+        mock_housekeep_count.assert_called_once_with(str(tmp_path), 5)
         assert result == 3
 
     def test_cleanup_directory_no_parameters(self, capsys):
@@ -165,14 +289,24 @@ class TestCleanupDirectory:
         captured = capsys.readouterr()
         assert "Specify days_old or keep_count" in captured.out
 
-    def test_cleanup_directory_both_parameters(self):
+    def test_cleanup_directory_both_parameters(self, tmp_path):
         """Test cleanup_directory with both parameters (should use age)."""
         with patch(
-            "py_utils.housekeeper.Housekeeper.housekeep_by_age"
+            "py_utils.housekeeper.Housekeeper._housekeep_by_age_unchecked"
         ) as mock_housekeep_age:
             mock_housekeep_age.return_value = 2
 
-            result = cleanup_directory("/test/dir", days_old=10, keep_count=5)
+            result = cleanup_directory(str(tmp_path), days_old=10, keep_count=5)
 
-            mock_housekeep_age.assert_called_once_with("/test/dir", 10)
+            mock_housekeep_age.assert_called_once_with(str(tmp_path), 10)
             assert result == 2
+
+    def test_cleanup_directory_invalid_directory(self, tmp_path):
+        """Test cleanup_directory with a missing directory or a file."""
+        with pytest.raises(FileNotFoundError):
+            cleanup_directory("/invalid/path", days_old=7)
+
+        file_path = tmp_path / "file.txt"
+        file_path.write_text("content")
+        with pytest.raises(NotADirectoryError, match="is not a directory"):
+            cleanup_directory(str(file_path), keep_count=1)
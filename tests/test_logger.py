@@ -1,5 +1,7 @@
 import logging
-from py_utils.logger import Logger, get_logger
+import logging.handlers
+import time
+from py_utils.logger import Logger, _LISTENERS, get_logger
 
 
 class TestLogger:
@@ -12,8 +14,10 @@ class TestLogger:
         assert logger.name == "test_logger"
         assert logger.level == logging.INFO
 
-        # Check handlers
-        handlers = logger.handlers
+        # Logger only enqueues; the listener owns the console handler
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+        handlers = _LISTENERS["test_logger"].handlers
         assert len(handlers) == 1
         assert isinstance(handlers[0], logging.StreamHandler)
 
@@ -25,13 +29,16 @@ class TestLogger:
         assert logger.name == "test_logger"
 
         # Check handlers
-        handlers = logger.handlers
+        assert len(logger.handlers) == 1
+        handlers = _LISTENERS["test_logger"].handlers
         assert len(handlers) == 2
 
-        # Should have both StreamHandler and FileHandler
+        # Should have both StreamHandler and a buffered FileHandler
         handler_types = [type(h) for h in handlers]
         assert logging.StreamHandler in handler_types
-        assert logging.FileHandler in handler_types
+        assert logging.handlers.MemoryHandler in handler_types
+        buffered = handlers[handler_types.index(logging.handlers.MemoryHandler)]
+        assert isinstance(buffered.target, logging.FileHandler)
 
     def test_setup_logger_custom_level(self):
         """Test setting up logger with custom logging level."""
@@ -48,6 +55,16 @@ class TestLogger:
         assert log_file.startswith(base_dir)
         assert "app_" in log_file
         assert ".log" in log_file
+        assert log_file.endswith(f"app_{time.strftime('%Y%m%d')}.log")
+
+    def test_get_default_log_file_date_rollover(self, tmp_path, monkeypatch):
+        """Test that the cached default path follows the current date."""
+        base_dir = str(tmp_path)
+        monkeypatch.setattr(time, "localtime", lambda: (2026, 1, 31, 0, 0, 0, 0, 0, 0))
+        assert Logger.get_default_log_file(base_dir).endswith("app_20260131.log")
+
+        monkeypatch.setattr(time, "localtime", lambda: (2026, 2, 1, 0, 0, 0, 0, 0, 0))
+        assert Logger.get_default_log_file(base_dir).endswith("app_20260201.log")
 
 
 def test_get_logger():
@@ -92,6 +109,7 @@ def test_log_file_creation(tmp_path):
     logger = Logger.setup_logger("file_test", log_file=str(log_file))
 
     logger.info("Test message")
+    Logger.flush_logger("file_test")
 
     # Check that file was created and contains the message
     assert log_file.exists()
@@ -99,3 +117,91 @@ def test_log_file_creation(tmp_path):
         content = f.read()
         assert "Test message" in content
         assert "file_test" in content  # Logger name should be in log
+
+
+def test_log_file_buffered(tmp_path):
+    """Test that file output is buffered until capacity or flush level."""
+    log_file = tmp_path / "buffered.log"
+    logger = Logger.setup_logger(
+        "buffered_test", log_file=str(log_file), buffer_capacity=10
+    )
+
+    listener = _LISTENERS["buffered_test"]
+
+    logger.info("Buffered message")
+    listener.stop()  # drain the queue without flushing the buffer
+    listener.start()
+    assert "Buffered message" not in log_file.read_text()
+
+    logger.error("Error message")
+    listener.stop()
+    listener.start()
+    content = log_file.read_text()
+    assert "Buffered message" in content
+    assert "Error message" in content
+
+
+def test_setup_logger_replaces_listener():
+    """Test that repeat setup stops the previous background listener."""
+    Logger.setup_logger(name="listener_test")
+    first = _LISTENERS["listener_test"]
+
+    logger = Logger.setup_logger(name="listener_test", level=logging.WARNING)
+
+    assert _LISTENERS["listener_test"] is not first
+    assert first._thread is None
+    assert len(logger.handlers) == 1
+
+
+def test_setup_logger_same_config_reused():
+    """Test that repeat setup with identical arguments keeps the handlers."""
+    logger = Logger.setup_logger(name="reuse_test")
+    handler = logger.handlers[0]
+    listener = _LISTENERS["reuse_test"]
+
+    assert Logger.setup_logger(name="reuse_test") is logger
+    assert logger.handlers == [handler]
+    assert _LISTENERS["reuse_test"] is listener
+
+    Logger.setup_logger(name="reuse_test", level=logging.DEBUG)
+    assert logger.handlers != [handler]
+    assert logger.level == logging.DEBUG
+
+
+def test_log_file_creates_directory(tmp_path):
+    """Test that missing log directories are created, and existing ones reused."""
+    log_file = tmp_path / "nested" / "logs" / "test.log"
+
+    Logger.setup_logger("dir_test", log_file=str(log_file))
+    Logger.setup_logger("dir_test", log_file=str(log_file), level=logging.DEBUG)
+
+    assert log_file.parent.is_dir()
+
+
+def test_setup_logger_fast(tmp_path, monkeypatch):
+    """Test fast mode omits source location from records and output."""
+    for attr in ("_srcfile", "logThreads", "logProcesses", "logMultiprocessing"):
+        monkeypatch.setattr(logging, attr, getattr(logging, attr))
+    log_file = tmp_path / "fast.log"
+
+    logger = Logger.setup_logger("fast_test", log_file=str(log_file), fast=True)
+    logger.info("Fast message")
+    Logger.flush_logger("fast_test")
+
+    content = log_file.read_text()
+    assert "fast_test - INFO - Fast message" in content
+    assert "test_logger.py" not in content
+    assert logging._srcfile is None
+
+
+def test_setup_logger_closes_replaced_file_handler(tmp_path):
+    """Test that reconfiguring a file logger closes the old log file."""
+    log_file = tmp_path / "reconfigure.log"
+    Logger.setup_logger("close_test", log_file=str(log_file))
+    buffered = _LISTENERS["close_test"].handlers[1]
+    file_handler = buffered.target
+    assert not file_handler.stream.closed
+
+    Logger.setup_logger("close_test", log_file=str(log_file), level=logging.DEBUG)
+
+    assert file_handler.stream is None or file_handler.stream.closed